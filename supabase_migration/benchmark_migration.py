@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+마이그레이션 파이프라인 벤치마크 - 로컬 MySQL/PostgreSQL 대역으로 단계별 성능 측정
+
+cafe24_backup/schemas의 실제 스키마로 임시 MySQL/PostgreSQL 데이터베이스를 만들고,
+같은 모양의 합성 데이터를 1x/10x/100x 규모로 채운 뒤 full_migration.py의 각 단계를 실행합니다.
+(1x = 실제 백업 파일의 행 수, 백업 파일이 없으면 --rows)
+
+측정 단계:
+    backup      MySQL → 백업 파일 (BACKUP_OPTIONS['format'])
+    convert     백업 파일 청크 단위 로드 + 변환 계획 적용 (DB 없이 순수 변환 비용)
+    insert      DROP/CREATE + execute_values 배치 INSERT
+    copy        DROP/CREATE + COPY ... FROM STDIN
+    sequences   reset_all_sequences
+
+단계별 실행 시간, 행/초, 단계 중 최대 RSS(MB, 단계 시작 대비 증가량 포함)를 JSON으로 저장하고,
+--baseline으로 이전 결과와 비교할 수 있습니다.
+
+=== 연결 정보 (환경 변수) ===
+
+    BENCH_MYSQL_HOST (기본 127.0.0.1)  BENCH_MYSQL_PORT (기본 3306)
+    BENCH_MYSQL_USER (기본 root)       BENCH_MYSQL_PASSWORD (기본 없음)
+    BENCH_PG_DSN (기본 postgresql://postgres@127.0.0.1:5432/postgres)
+
+    임시 데이터베이스(bench_migration_<pid>)를 만들 수 있는 권한이 필요하며,
+    측정 후 삭제됩니다 (--keep 지정 시 유지).
+
+=== 사용법 ===
+
+    # 기본 (v2_priced_TS, v2_bills, LS_* 테이블, 1x/10x/100x)
+    python benchmark_migration.py
+
+    # 규모/테이블 지정
+    python benchmark_migration.py --scales 1 10 --tables v2_bills LS_confirm
+
+    # 결과 저장 후 다음 실행에서 비교
+    python benchmark_migration.py --output before.json
+    python benchmark_migration.py --output after.json --baseline before.json
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import gc
+import io
+import json
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import pymysql
+import psycopg2
+
+import full_migration as fm
+
+# 기본 벤치마크 대상 테이블 (fnmatch 패턴)
+DEFAULT_TABLES = ['v2_priced_TS', 'v2_bills', 'LS_*']
+
+# 기본 규모 (실제 백업 행 수 대비 배수)
+DEFAULT_SCALES = [1, 10, 100]
+
+# 실제 백업 파일이 없는 테이블의 1x 행 수
+DEFAULT_BASE_ROWS = 1000
+
+# 합성 데이터 삽입 배치 크기
+SEED_BATCH_SIZE = 2000
+
+# 합성 문자열에 사용할 문자 (한글 포함, utf8mb4 인코딩 비용 반영)
+SYNTHETIC_CHARS = string.ascii_letters + string.digits + '가나다라마바사아자차카타파하'
+
+STAGES = ['backup', 'convert', 'insert', 'copy', 'sequences']
+
+# 단계 실행 중 현재 RSS를 읽는 간격(초)
+RSS_SAMPLE_INTERVAL = 0.01
+
+# 측정 후 임시 DB/파일 유지 여부 (--keep)
+KEEP_DATABASES = False
+
+
+# ==================== 연결 정보 ====================
+
+def get_mysql_config() -> Dict[str, Any]:
+    """로컬 MySQL 연결 정보 (환경 변수)"""
+    return {
+        'host': os.environ.get('BENCH_MYSQL_HOST', '127.0.0.1'),
+        'port': int(os.environ.get('BENCH_MYSQL_PORT', '3306')),
+        'user': os.environ.get('BENCH_MYSQL_USER', 'root'),
+        'password': os.environ.get('BENCH_MYSQL_PASSWORD', ''),
+        'charset': 'utf8mb4',
+    }
+
+
+def get_pg_dsn() -> str:
+    """로컬 PostgreSQL 연결 문자열 (환경 변수)"""
+    return os.environ.get('BENCH_PG_DSN', 'postgresql://postgres@127.0.0.1:5432/postgres')
+
+
+# ==================== 대상 테이블 / 합성 데이터 ====================
+
+def select_tables(patterns: List[str]) -> List[str]:
+    """스키마 디렉토리에서 패턴과 일치하는 테이블 목록"""
+    available = sorted(
+        filename[:-len('_schema.json')]
+        for filename in os.listdir(fm.SCHEMA_DIR)
+        if filename.endswith('_schema.json')
+    )
+    selected = []
+    for pattern in patterns:
+        matched = [name for name in available if fnmatch.fnmatchcase(name, pattern)]
+        if not matched:
+            print(f"⚠ 일치하는 스키마 없음: {pattern}")
+        selected += [name for name in matched if name not in selected]
+    return selected
+
+
+def count_backup_rows(table_name: str) -> int:
+    """실제 백업 파일의 행 수 (없으면 DEFAULT_BASE_ROWS)"""
+    data = fm.load_table_data(table_name)
+    return len(data) if data else DEFAULT_BASE_ROWS
+
+
+def make_value_generator(col: Dict[str, Any], rng: random.Random):
+    """컬럼 타입에 맞는 합성 값 생성 함수 (인수: 행 번호)"""
+    base, args, unsigned = fm.parse_mysql_type(col['Type'])
+    is_key = col['Key'] == 'PRI'
+    nullable = col['Null'] == 'YES' and not is_key
+
+    def maybe_null(generate):
+        if not nullable:
+            return generate
+        return lambda i: None if rng.random() < 0.1 else generate(i)
+
+    if base in ('tinyint', 'bit', 'bool', 'boolean') and fm.mysql_type_to_postgresql(col['Type']) == 'BOOLEAN':
+        return maybe_null(lambda i: rng.randint(0, 1))
+    if base in ('tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint', 'year'):
+        if is_key:
+            return lambda i: i + 1
+        upper = {'tinyint': 127, 'smallint': 32767, 'year': 2100}.get(base, 1_000_000)
+        return maybe_null(lambda i: rng.randint(1900 if base == 'year' else 0, upper))
+    if base in ('decimal', 'numeric'):
+        precision = int(args[0]) if args else 10
+        scale = int(args[1]) if len(args) > 1 else 0
+        upper = 10 ** min(precision - scale, 9) - 1
+        return maybe_null(lambda i: Decimal(rng.randint(0, upper * 10 ** scale)).scaleb(-scale))
+    if base in ('float', 'double', 'real'):
+        return maybe_null(lambda i: round(rng.uniform(0, 100000), 2))
+    if base in ('char', 'varchar'):
+        length = int(args[0]) if args else 20
+        if is_key:
+            return lambda i: str(i + 1).zfill(min(length, 8))[-length:]
+        return maybe_null(lambda i: ''.join(rng.choices(SYNTHETIC_CHARS, k=rng.randint(1, min(length, 30)))))
+    if base in ('tinytext', 'text', 'mediumtext', 'longtext', 'json'):
+        if base == 'json':
+            return maybe_null(lambda i: json.dumps({'n': i}))
+        return maybe_null(lambda i: ''.join(rng.choices(SYNTHETIC_CHARS, k=rng.randint(20, 200))))
+    if base in ('enum', 'set'):
+        return maybe_null(lambda i: rng.choice(args) if args else '')
+    if base == 'date':
+        return maybe_null(lambda i: date(2020, 1, 1) + timedelta(days=rng.randint(0, 2000)))
+    if base in ('datetime', 'timestamp'):
+        return maybe_null(lambda i: datetime(2020, 1, 1) + timedelta(seconds=rng.randint(0, 170_000_000)))
+    if base == 'time':
+        return maybe_null(lambda i: dt_time(rng.randint(0, 23), rng.choice((0, 10, 20, 30, 40, 50))))
+    if base in ('binary', 'varbinary', 'tinyblob', 'blob', 'mediumblob', 'longblob'):
+        return maybe_null(lambda i: bytes(rng.getrandbits(8) for _ in range(16)))
+    return maybe_null(lambda i: str(i))
+
+
+def seed_mysql_table(db, schema: Dict[str, Any], row_count: int, rng: random.Random):
+    """MySQL 임시 DB에 테이블 생성 후 합성 데이터 삽입"""
+    table_name = schema['table_name']
+    columns = schema['columns']
+    generators = [make_value_generator(col, rng) for col in columns]
+
+    cols_sql = ', '.join(f'`{col["Field"]}`' for col in columns)
+    placeholders = ', '.join(['%s'] * len(columns))
+    insert_sql = f'INSERT INTO `{table_name}` ({cols_sql}) VALUES ({placeholders})'
+
+    with db.cursor() as cursor:
+        cursor.execute(schema['create_statement'])
+        for offset in range(0, row_count, SEED_BATCH_SIZE):
+            batch = [
+                tuple(generate(i) for generate in generators)
+                for i in range(offset, min(offset + SEED_BATCH_SIZE, row_count))
+            ]
+            cursor.executemany(insert_sql, batch)
+    db.commit()
+
+
+# ==================== 임시 데이터베이스 ====================
+
+def create_mysql_database(name: str):
+    config = get_mysql_config()
+    with contextlib.closing(pymysql.connect(**config)) as db:
+        with db.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS `{name}`')
+            cursor.execute(f'CREATE DATABASE `{name}` CHARACTER SET utf8mb4')
+    return pymysql.connect(**config, db=name)
+
+
+def drop_mysql_database(name: str):
+    with contextlib.closing(pymysql.connect(**get_mysql_config())) as db:
+        with db.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS `{name}`')
+
+
+def create_pg_database(name: str):
+    admin = psycopg2.connect(get_pg_dsn())
+    admin.autocommit = True
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS {name}')
+            cursor.execute(f'CREATE DATABASE {name}')
+    finally:
+        admin.close()
+    return psycopg2.connect(get_pg_dsn(), dbname=name)
+
+
+def drop_pg_database(name: str):
+    admin = psycopg2.connect(get_pg_dsn())
+    admin.autocommit = True
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS {name}')
+    finally:
+        admin.close()
+
+
+def point_migration_at(work_dir: str, mysql_db: str):
+    """full_migration의 MySQL 설정과 백업 경로를 임시 환경으로 변경"""
+    fm.MYSQL_CONFIG.clear()
+    fm.MYSQL_CONFIG.update(get_mysql_config(), db=mysql_db)
+    fm.BACKUP_DIR = work_dir
+    fm.SCHEMA_DIR = os.path.join(work_dir, 'schemas')
+    fm.DATA_DIR = os.path.join(work_dir, 'data')
+    fm.DELTA_DIR = os.path.join(fm.DATA_DIR, 'deltas')
+    fm.SUMMARY_FILE = os.path.join(work_dir, 'backup_summary.json')
+    fm.JOURNAL_FILE = os.path.join(work_dir, 'migration_journal.json')
+    fm.MANIFEST_FILE = os.path.join(work_dir, 'backup_manifest.json')
+    fm.ensure_directories()
+
+
+# ==================== 측정 ====================
+
+class RssSampler:
+    """단계 실행 중 현재 RSS를 주기적으로 읽어 단계 안에서의 최대값 기록
+    
+    ru_maxrss는 프로세스 전체의 최대값이라 앞 단계(시딩, 이전 규모)의 사용량이 섞이므로
+    단계마다 따로 샘플링함.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.start_mb = fm.current_rss_mb()
+        self.peak_mb = self.start_mb
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        rss = fm.current_rss_mb()
+        if rss is not None and (self.peak_mb is None or rss > self.peak_mb):
+            self.peak_mb = rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        if self.start_mb is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread.is_alive():
+            self._stop.set()
+            self._thread.join()
+        self._sample()
+        return False
+
+
+def measure(stage_results: Dict[str, Any], stage: str, rows: int, func, verbose: bool = False):
+    """단계 실행 시간/처리량/단계 중 최대 RSS 기록 (full_migration 출력은 verbose가 아니면 숨김)"""
+    output = io.StringIO()
+    # 앞 단계에서 남은 객체를 정리해 시작 RSS를 낮춤
+    gc.collect()
+    with RssSampler() as sampler:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(sys.stdout if verbose else output):
+            func()
+        elapsed = time.perf_counter() - started
+
+    result = {
+        'seconds': round(elapsed, 4),
+        'rows': rows,
+        'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else None,
+    }
+    if sampler.peak_mb is not None:
+        result['peak_rss_mb'] = round(sampler.peak_mb, 1)
+        result['rss_growth_mb'] = round(sampler.peak_mb - sampler.start_mb, 1)
+        rss_text = f"RSS {result['peak_rss_mb']:.0f}MB (+{result['rss_growth_mb']:.0f}MB)"
+    elif fm.process_peak_rss_mb() is not None:
+        # /proc가 없는 환경은 단계별 값을 구할 수 없으므로 프로세스 최대값으로 따로 표시
+        result['process_peak_rss_mb'] = round(fm.process_peak_rss_mb(), 1)
+        rss_text = f"프로세스 최대 RSS {result['process_peak_rss_mb']:.0f}MB"
+    else:
+        rss_text = ''
+    stage_results[stage] = result
+    print(f"  ✓ {stage:<10} {elapsed:8.2f}초  {result['rows_per_sec'] or 0:>12,.0f}행/초  {rss_text}")
+
+
+def run_scale(tables: List[str], base_rows: Dict[str, int], scale: int, verbose: bool = False) -> Dict[str, Any]:
+    """한 규모에 대해 전체 단계 측정 (임시 DB 생성 → 측정 → 삭제)"""
+    db_name = f'bench_migration_{os.getpid()}_{scale}x'
+    work_dir = tempfile.mkdtemp(prefix='bench_migration_')
+    schemas = {table_name: fm.load_table_schema(table_name) for table_name in tables}
+    row_counts = {table_name: base_rows[table_name] * scale for table_name in tables}
+    total_rows = sum(row_counts.values())
+
+    print(f"\n[{scale}x] {len(tables)}개 테이블, {total_rows:,}개 행")
+    print("-" * 60)
+
+    mysql_db = create_mysql_database(db_name)
+    pg_conn = create_pg_database(db_name)
+    original_dirs = (fm.BACKUP_DIR, fm.SCHEMA_DIR, fm.DATA_DIR, fm.DELTA_DIR, fm.SUMMARY_FILE, fm.JOURNAL_FILE,
+                     fm.MANIFEST_FILE)
+    original_mysql = dict(fm.MYSQL_CONFIG)
+    original_method = fm.MIGRATION_OPTIONS['load_method']
+    stages = {}
+
+    try:
+        rng = random.Random(scale)
+        seeded = []
+        for table_name in tables:
+            try:
+                seed_mysql_table(mysql_db, schemas[table_name], row_counts[table_name], rng)
+                seeded.append(table_name)
+            except Exception as e:
+                print(f"  ⚠ 합성 데이터 생성 실패 - 제외: {table_name} ({str(e)[:80]})")
+                mysql_db.rollback()
+        total_rows = sum(row_counts[table_name] for table_name in seeded)
+
+        point_migration_at(work_dir, db_name)
+
+        def backup():
+            cursor = mysql_db.cursor()
+            try:
+                for table_name in seeded:
+                    fm.backup_single_table(mysql_db, cursor, table_name)
+            finally:
+                cursor.close()
+
+        def convert():
+            # 실제 로더와 같이 청크 단위로 읽으면서 청크마다 변환 계획 적용
+            for table_name in seeded:
+                for chunk in fm.iter_table_data_chunks(table_name) or ():
+                    columns, plan, mixed_case = fm.build_conversion_plan(table_name.lower(), chunk)
+                    for _ in fm.iter_insert_rows(chunk, columns, plan, mixed_case):
+                        pass
+
+        def load(method: str):
+            def run():
+                fm.MIGRATION_OPTIONS['load_method'] = method
+                with pg_conn.cursor() as cursor:
+                    for table_name in seeded:
+                        if fm.migrate_table(cursor, table_name):
+                            fm.commit_migrated_table(pg_conn, table_name)
+                        else:
+                            pg_conn.rollback()
+            return run
+
+        def sequences():
+            with pg_conn.cursor() as cursor:
+                fm.reset_all_sequences(cursor)
+            pg_conn.commit()
+
+        measure(stages, 'backup', total_rows, backup, verbose)
+        measure(stages, 'convert', total_rows, convert, verbose)
+        measure(stages, 'insert', total_rows, load('insert'), verbose)
+        measure(stages, 'copy', total_rows, load('copy'), verbose)
+        measure(stages, 'sequences', len(seeded), sequences, verbose)
+
+        stages['_meta'] = {
+            'tables': seeded,
+            'rows': total_rows,
+            'backup_bytes': sum(
+                os.path.getsize(os.path.join(fm.DATA_DIR, filename))
+                for filename in os.listdir(fm.DATA_DIR)
+                if os.path.isfile(os.path.join(fm.DATA_DIR, filename))
+            ),
+        }
+        return stages
+
+    finally:
+        (fm.BACKUP_DIR, fm.SCHEMA_DIR, fm.DATA_DIR, fm.DELTA_DIR,
+         fm.SUMMARY_FILE, fm.JOURNAL_FILE, fm.MANIFEST_FILE) = original_dirs
+        fm.MYSQL_CONFIG.clear()
+        fm.MYSQL_CONFIG.update(original_mysql)
+        fm.MIGRATION_OPTIONS['load_method'] = original_method
+        mysql_db.close()
+        pg_conn.close()
+        if not KEEP_DATABASES:
+            drop_mysql_database(db_name)
+            drop_pg_database(db_name)
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            print(f"  임시 DB/파일 유지: {db_name}, {work_dir}")
+
+
+# ==================== 결과 비교 ====================
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any]):
+    """이전 결과 대비 단계별 시간 변화 출력 (음수 = 빨라짐)"""
+    print("\n" + "=" * 60)
+    print(f"기준 결과 대비 ({baseline.get('timestamp', '?')})")
+    print("=" * 60)
+    print(f"{'규모':<6} {'단계':<10} {'기준(초)':>10} {'현재(초)':>10} {'변화':>9}")
+    print("-" * 60)
+
+    for scale, stages in report['scales'].items():
+        base_stages = baseline.get('scales', {}).get(scale)
+        if not base_stages:
+            continue
+        for stage in STAGES:
+            current = stages.get(stage)
+            previous = base_stages.get(stage)
+            if not current or not previous or not previous['seconds']:
+                continue
+            change = (current['seconds'] - previous['seconds']) / previous['seconds'] * 100
+            print(f"{scale:<6} {stage:<10} {previous['seconds']:>10.2f} {current['seconds']:>10.2f} {change:>+8.1f}%")
+
+
+def main():
+    global KEEP_DATABASES, DEFAULT_BASE_ROWS
+
+    parser = argparse.ArgumentParser(
+        description='마이그레이션 파이프라인 벤치마크 (로컬 MySQL/PostgreSQL)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--tables', nargs='+', default=DEFAULT_TABLES, help='대상 테이블 (패턴 가능, 기본: v2_priced_TS v2_bills LS_*)')
+    parser.add_argument('--scales', nargs='+', type=int, default=DEFAULT_SCALES, help='규모 배수 (기본: 1 10 100)')
+    parser.add_argument('--rows', type=int, default=DEFAULT_BASE_ROWS, help='백업 파일이 없는 테이블의 1x 행 수')
+    parser.add_argument('--format', choices=['json', 'jsonl', 'columnar'], default='json', help='백업 형식')
+    parser.add_argument('--output', default='benchmark_report.json', help='결과 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--keep', action='store_true', help='임시 DB와 백업 파일 유지')
+    parser.add_argument('--verbose', action='store_true', help='full_migration 출력 표시')
+    args = parser.parse_args()
+
+    DEFAULT_BASE_ROWS = args.rows
+    KEEP_DATABASES = args.keep
+    fm.BACKUP_OPTIONS['format'] = args.format
+    # 같은 데이터를 insert/copy로 반복 적재하므로 변경 없는 테이블 건너뛰기는 끔
+    fm.BACKUP_OPTIONS['skip_unchanged'] = False
+    fm.MIGRATION_OPTIONS['skip_unchanged'] = False
+
+    tables = select_tables(args.tables)
+    if not tables:
+        print("❌ 벤치마크할 테이블이 없습니다.")
+        sys.exit(1)
+
+    # 1x 행 수는 실제 백업 파일 기준
+    base_rows = {table_name: count_backup_rows(table_name) for table_name in tables}
+
+    print("=" * 60)
+    print("마이그레이션 벤치마크")
+    print("=" * 60)
+    print(f"테이블: {', '.join(tables)}")
+    print(f"규모: {', '.join(f'{scale}x' for scale in args.scales)} (1x = {sum(base_rows.values()):,}개 행)")
+    print(f"백업 형식: {args.format}")
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'backup_format': args.format,
+        'base_rows': base_rows,
+        'scales': {},
+    }
+
+    for scale in args.scales:
+        try:
+            report['scales'][f'{scale}x'] = run_scale(tables, base_rows, scale, args.verbose)
+        except Exception as e:
+            print(f"❌ {scale}x 벤치마크 실패: {e}")
+            import traceback
+            traceback.print_exc()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            compare_with_baseline(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+큰 JSON 파일의 배열 원소를 한 번에 하나씩 읽는 스트리밍 리더
+
+full_migration.py(백업 데이터 로드)와 supabase_query.py(--insert-file/--upsert-file)에서 공용으로 사용.
+"""
+
+import json
+from typing import Any
+
+
+# 들여쓰기된 백업 JSON을 나눠 읽을 때 한 번에 읽는 크기 (문자 수)
+JSON_READ_BLOCK_SIZE = 64 * 1024
+# 배열/객체 안의 값 하나가 온전히 끝났음을 알 수 있는 다음 문자
+JSON_VALUE_TERMINATORS = ' \t\r\n,:]}'
+
+
+class JsonArrayReader:
+    """백업 JSON({"table_name": ..., "data": [...]})에서 data 배열의 행을 하나씩 읽기 (최상위 배열도 가능)
+    
+    파일 전체를 json.load 하지 않고 블록 단위로 읽으면서 raw_decode로 원소를 하나씩 해석하므로,
+    메모리에는 현재 블록과 읽고 있는 행만 남음.
+    """
+    
+    def __init__(self, f, array_key: str = 'data'):
+        self.f = f
+        self.array_key = array_key
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def _fill(self) -> bool:
+        """다음 블록을 읽어 버퍼에 추가 (이미 해석한 앞부분은 버림)"""
+        if self.eof:
+            return False
+        block = self.f.read(JSON_READ_BLOCK_SIZE)
+        if not block:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + block
+        self.pos = 0
+        return True
+    
+    def _peek(self) -> str:
+        """공백을 건너뛰고 다음 문자 반환 (파일 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+    
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"백업 JSON 형식 오류: '{char}' 대신 '{found}'")
+        self.pos += 1
+    
+    def _decode(self) -> Any:
+        """현재 위치의 JSON 값 하나 해석 (블록 경계에 걸리면 더 읽고 다시 시도)"""
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # 값 뒤에 구분자가 오지 않으면(버퍼 끝, '2.' | '5' 처럼 숫자 중간에서 잘림 등)
+                # 뒤가 잘렸을 수 있으므로 더 읽고 다시 해석
+                if self.eof or (end < len(self.buffer) and self.buffer[end] in JSON_VALUE_TERMINATORS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+    
+    def _iter_array(self):
+        """현재 위치의 배열 원소를 하나씩 해석"""
+        self._expect('[')
+        if self._peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self._decode()
+            separator = self._peek()
+            self.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"백업 JSON 형식 오류: 배열 구분자 '{separator}'")
+    
+    def __iter__(self):
+        # 최상위가 배열인 파일([{...}, ...])은 그 원소를 그대로 읽음
+        if self._peek() == '[':
+            yield from self._iter_array()
+            return
+        
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        
+        while True:
+            key = self._decode()
+            self._expect(':')
+            
+            if key == self.array_key:
+                yield from self._iter_array()
+            else:
+                self._decode()
+            
+            separator = self._peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"백업 JSON 형식 오류: 객체 구분자 '{separator}'")
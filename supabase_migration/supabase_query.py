@@ -39,12 +39,22 @@ Supabase Query Tool - MCP 대용 만능 DB 조회 도구
     # 컬럼별 데이터 샘플 및 통계
     python supabase_query.py --analyze v2_staff_manager
 
+    # 큰 테이블은 일부 블록만 읽어 근사 통계 (1%)
+    python supabase_query.py --analyze v2_priced_ts --sample 1
+
+    # 모든 테이블 동시 분석 → 파일 저장, 이전 결과와 비교
+    python supabase_query.py --analyze-all --workers 4 --output profile.json
+    python supabase_query.py --analyze-all --output profile_new.csv --diff profile.json
+
     # 특정 컬럼의 고유값 목록
     python supabase_query.py --distinct v2_staff_manager.staff_status
 
     # 컬럼별 NULL 비율
     python supabase_query.py --null-check v2_staff_manager
 
+    # 여러 테이블 NULL 비율 (테이블당 쿼리 1번, --estimate면 pg_stats로 즉시 추정)
+    python supabase_query.py --null-check "v2_%,v3_%" --estimate
+
 === 데이터 조회 ===
 
     # 기본 조회
@@ -68,6 +78,10 @@ Supabase Query Tool - MCP 대용 만능 DB 조회 도구
     # JSON 출력
     python supabase_query.py -t v2_staff_manager -l 3 --json
 
+    # 파일로 내보내기 (서버 측 커서로 스트리밍, 기본은 전체 행)
+    python supabase_query.py -t v2_bills --export v2_bills.jsonl
+    python supabase_query.py -t v2_priced_ts -w "branch_id=test" --export priced_ts.csv
+
 === SQL 직접 실행 ===
 
     python supabase_query.py --sql "SELECT COUNT(*) FROM v2_staff_manager"
@@ -82,18 +96,31 @@ Supabase Query Tool - MCP 대용 만능 DB 조회 도구
 
     # DELETE (where 필수)
     python supabase_query.py -t v2_test --delete -w "name=test"
+
+    # 파일 일괄 INSERT / UPSERT (.jsonl, .json, .csv, 배치마다 커밋)
+    python supabase_query.py -t v2_test --insert-file rows.jsonl
+    python supabase_query.py -t v2_test --upsert-file rows.csv --conflict branch_id,name --batch-size 2000
 """
 
+import csv
 import json
 import argparse
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, time as datetime_time
+from uuid import UUID
 from decimal import Decimal
 
+from json_stream import JsonArrayReader
+
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import Json, RealDictCursor, execute_values
+    from psycopg2.extensions import quote_ident
+    from psycopg2.pool import ThreadedConnectionPool
 except ImportError:
     print("psycopg2 패키지가 필요합니다. 설치: pip install psycopg2-binary")
     sys.exit(1)
@@ -127,10 +154,14 @@ def get_connection():
 
 def json_serial(obj):
     """JSON 직렬화 헬퍼"""
-    if isinstance(obj, (datetime, date)):
+    if isinstance(obj, (datetime, date, datetime_time)):
         return obj.isoformat()
     if isinstance(obj, Decimal):
         return float(obj)
+    if isinstance(obj, (timedelta, UUID)):
+        return str(obj)
+    if isinstance(obj, (memoryview, bytes, bytearray)):
+        return bytes(obj).hex()
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
@@ -196,8 +227,12 @@ def list_views(conn):
 # 스키마 정보
 # ============================================
 
-def get_schema(conn, table_name):
-    """테이블 기본 스키마 조회"""
+def fetch_columns(conn, table_name):
+    """테이블 컬럼 정보 조회 (출력 없음)
+
+    반환: [(column_name, data_type, character_maximum_length, numeric_precision,
+            is_nullable, column_default, column_comment, numeric_scale), ...]
+    """
     query = """
         SELECT
             c.column_name,
@@ -209,14 +244,20 @@ def get_schema(conn, table_name):
             col_description(
                 (SELECT oid FROM pg_class WHERE relname = c.table_name),
                 c.ordinal_position
-            ) as column_comment
+            ) as column_comment,
+            c.numeric_scale
         FROM information_schema.columns c
         WHERE c.table_schema = 'public' AND c.table_name = %s
         ORDER BY c.ordinal_position
     """
     with conn.cursor() as cur:
         cur.execute(query, (table_name,))
-        columns = cur.fetchall()
+        return cur.fetchall()
+
+
+def get_schema(conn, table_name):
+    """테이블 기본 스키마 조회"""
+    columns = fetch_columns(conn, table_name)
 
     if not columns:
         print(f"❌ 테이블 '{table_name}'을 찾을 수 없습니다.")
@@ -228,7 +269,7 @@ def get_schema(conn, table_name):
     print("-" * 90)
 
     for col in columns:
-        name, dtype, char_len, num_prec, nullable, default, comment = col
+        name, dtype, char_len, num_prec, nullable, default, comment = col[:7]
 
         # 타입 포맷팅
         type_str = dtype
@@ -459,9 +500,18 @@ def show_all_relations(conn):
 # 데이터 분석
 # ============================================
 
-def analyze_table(conn, table_name):
-    """테이블 데이터 분석 (컬럼별 통계)"""
-    # 먼저 컬럼 목록 가져오기
+# 통계 종류별 컬럼 타입 (information_schema.columns.data_type 기준)
+NUMERIC_TYPES = ('integer', 'bigint', 'numeric', 'real', 'double precision')
+TEXT_TYPES = ('character varying', 'text', 'character')
+# 등호 연산자가 없어 COUNT(DISTINCT)에 text로 변환해야 하는 타입
+NO_EQUALITY_TYPES = ('json', 'xml', 'point')
+
+# 문자형 컬럼마다 보여줄 상위 값 수
+PROFILE_TOP_VALUES = 5
+
+
+def fetch_column_types(conn, table_name):
+    """테이블의 (컬럼명, 데이터 타입) 목록"""
     col_query = """
         SELECT column_name, data_type
         FROM information_schema.columns
@@ -470,61 +520,124 @@ def analyze_table(conn, table_name):
     """
     with conn.cursor() as cur:
         cur.execute(col_query, (table_name,))
-        columns = cur.fetchall()
+        return cur.fetchall()
+
+
+def profile_table(conn, table_name, sample_pct=None):
+    """테이블의 컬럼별 통계를 스캔 두 번으로 계산
 
+    1) 모든 컬럼의 NULL 수, DISTINCT 수, 숫자형 MIN/MAX/AVG를 SELECT 하나로 집계
+    2) 문자형 컬럼의 상위 값은 LATERAL VALUES로 컬럼을 행으로 펼쳐 GROUP BY 한 번으로 계산
+    sample_pct를 주면 TABLESAMPLE SYSTEM으로 일부 블록만 읽어 근사값을 구함
+    (두 스캔이 같은 표본을 보도록 REPEATABLE 시드 고정).
+
+    반환값: {'table', 'total_rows', 'sample_pct', 'columns': [{컬럼별 통계}, ...]}, 테이블이 없으면 None
+    """
+    columns = fetch_column_types(conn, table_name)
     if not columns:
-        print(f"❌ 테이블 '{table_name}'을 찾을 수 없습니다.")
-        return
+        return None
 
-    # 행 수
     with conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-        total_rows = cur.fetchone()[0]
-
-    print(f"\n📊 테이블 분석: {table_name}")
-    print(f"   총 행 수: {total_rows:,}")
+        table = quote_ident(table_name, cur)
+        source = table
+        if sample_pct:
+            source = f"{table} TABLESAMPLE SYSTEM ({float(sample_pct)}) REPEATABLE (0)"
+
+        select_list = ["COUNT(*)"]
+        for col_name, col_type in columns:
+            col = quote_ident(col_name, cur)
+            distinct_expr = f"{col}::text" if col_type in NO_EQUALITY_TYPES else col
+            select_list.append(f"COUNT(*) FILTER (WHERE {col} IS NULL)")
+            select_list.append(f"COUNT(DISTINCT {distinct_expr})")
+            if col_type in NUMERIC_TYPES:
+                select_list.extend([f"MIN({col})", f"MAX({col})", f"AVG({col})"])
+
+        cur.execute(f"SELECT {', '.join(select_list)} FROM {source}")
+        values = iter(cur.fetchone())
+        total_rows = next(values)
+
+        profile_columns = []
+        for col_name, col_type in columns:
+            stats = {
+                'name': col_name,
+                'type': col_type,
+                'nulls': next(values),
+                'distinct': next(values),
+            }
+            if col_type in NUMERIC_TYPES:
+                stats['min'], stats['max'], stats['avg'] = next(values), next(values), next(values)
+            profile_columns.append(stats)
+
+        text_columns = [stats for stats in profile_columns if stats['type'] in TEXT_TYPES]
+        if text_columns and total_rows:
+            pairs = ", ".join(
+                f"(%s, {quote_ident(stats['name'], cur)}::text)" for stats in text_columns
+            )
+            cur.execute(f"""
+                SELECT col, val, cnt
+                FROM (
+                    SELECT v.col, v.val, COUNT(*) AS cnt,
+                           ROW_NUMBER() OVER (PARTITION BY v.col ORDER BY COUNT(*) DESC, v.val) AS rn
+                    FROM {source}
+                    CROSS JOIN LATERAL (VALUES {pairs}) AS v(col, val)
+                    WHERE v.val IS NOT NULL
+                    GROUP BY v.col, v.val
+                ) ranked
+                WHERE rn <= %s
+                ORDER BY col, rn
+            """, [stats['name'] for stats in text_columns] + [PROFILE_TOP_VALUES])
+            top_values = {}
+            for col_name, value, count in cur.fetchall():
+                top_values.setdefault(col_name, []).append((value, count))
+            for stats in text_columns:
+                stats['top'] = top_values.get(stats['name'], [])
+
+    return {
+        'table': table_name,
+        'total_rows': total_rows,
+        'sample_pct': sample_pct,
+        'columns': profile_columns,
+    }
+
+
+def print_table_profile(profile):
+    """profile_table 결과 출력"""
+    total_rows = profile['total_rows']
+
+    print(f"\n📊 테이블 분석: {profile['table']}")
+    if profile['sample_pct']:
+        print(f"   표본 행 수: {total_rows:,} (TABLESAMPLE {profile['sample_pct']}%, 근사값)")
+    else:
+        print(f"   총 행 수: {total_rows:,}")
     print("=" * 80)
 
-    for col_name, col_type in columns:
-        print(f"\n▸ {col_name} ({col_type})")
+    for stats in profile['columns']:
+        print(f"\n▸ {stats['name']} ({stats['type']})")
 
-        with conn.cursor() as cur:
-            # NULL 개수
-            cur.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {col_name} IS NULL")
-            null_count = cur.fetchone()[0]
-            null_pct = (null_count / total_rows * 100) if total_rows > 0 else 0
-
-            # DISTINCT 개수
-            cur.execute(f"SELECT COUNT(DISTINCT {col_name}) FROM {table_name}")
-            distinct_count = cur.fetchone()[0]
-
-            print(f"   NULL: {null_count:,} ({null_pct:.1f}%) | DISTINCT: {distinct_count:,}")
-
-            # 숫자형이면 min/max/avg
-            if col_type in ('integer', 'bigint', 'numeric', 'real', 'double precision'):
-                cur.execute(f"SELECT MIN({col_name}), MAX({col_name}), AVG({col_name}) FROM {table_name}")
-                min_val, max_val, avg_val = cur.fetchone()
-                if min_val is not None:
-                    print(f"   MIN: {min_val} | MAX: {max_val} | AVG: {avg_val:.2f if avg_val else 0}")
-
-            # 문자형이면 샘플 값들
-            elif col_type in ('character varying', 'text', 'character'):
-                cur.execute(f"""
-                    SELECT {col_name}, COUNT(*) as cnt
-                    FROM {table_name}
-                    WHERE {col_name} IS NOT NULL
-                    GROUP BY {col_name}
-                    ORDER BY cnt DESC
-                    LIMIT 5
-                """)
-                samples = cur.fetchall()
-                if samples:
-                    print(f"   TOP 값: ", end="")
-                    sample_strs = [f"'{v}'({c})" for v, c in samples]
-                    print(", ".join(sample_strs))
+        null_count = stats['nulls']
+        null_pct = (null_count / total_rows * 100) if total_rows > 0 else 0
+        print(f"   NULL: {null_count:,} ({null_pct:.1f}%) | DISTINCT: {stats['distinct']:,}")
+
+        # 숫자형이면 min/max/avg
+        if stats.get('min') is not None:
+            print(f"   MIN: {stats['min']} | MAX: {stats['max']} | AVG: {stats['avg']:.2f}")
+
+        # 문자형이면 샘플 값들
+        if stats.get('top'):
+            sample_strs = [f"'{v}'({c})" for v, c in stats['top']]
+            print(f"   TOP 값: {', '.join(sample_strs)}")
     print()
 
 
+def analyze_table(conn, table_name, sample_pct=None):
+    """테이블 데이터 분석 (컬럼별 통계)"""
+    profile = profile_table(conn, table_name, sample_pct)
+    if profile is None:
+        print(f"❌ 테이블 '{table_name}'을 찾을 수 없습니다.")
+        return
+    print_table_profile(profile)
+
+
 def show_distinct_values(conn, table_column):
     """특정 컬럼의 고유값 목록"""
     if '.' not in table_column:
@@ -557,33 +670,82 @@ def show_distinct_values(conn, table_column):
         print(f"❌ 오류: {e}")
 
 
-def check_nulls(conn, table_name):
-    """컬럼별 NULL 비율 체크"""
+def fetch_table_columns(conn, table_names):
+    """테이블별 컬럼 목록을 한 번에 조회 (이름에 %가 있으면 LIKE 패턴)
+
+    패턴에서는 %만 와일드카드이고 _와 \\는 글자 그대로 비교함 (v2_%가 v2x...와 맞지 않도록).
+    반환값: {테이블명: [컬럼명, ...]} (테이블명 순)
+    """
+    exact = [name for name in table_names if '%' not in name]
+    patterns = [
+        name.replace('\\', '\\\\').replace('_', '\\_')
+        for name in table_names if '%' in name
+    ]
     col_query = """
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_schema = 'public' AND table_name = %s
-        ORDER BY ordinal_position
+        SELECT c.table_name, c.column_name
+        FROM information_schema.columns c
+        JOIN information_schema.tables t
+          ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+        WHERE c.table_schema = 'public' AND t.table_type = 'BASE TABLE'
+          AND (c.table_name = ANY(%s) OR c.table_name LIKE ANY(%s))
+        ORDER BY c.table_name, c.ordinal_position
     """
     with conn.cursor() as cur:
-        cur.execute(col_query, (table_name,))
-        columns = [row[0] for row in cur.fetchall()]
+        cur.execute(col_query, (exact, patterns))
+        rows = cur.fetchall()
 
-        cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-        total = cur.fetchone()[0]
+    columns = {}
+    for table_name, column_name in rows:
+        columns.setdefault(table_name, []).append(column_name)
+    return columns
+
+
+def count_nulls(conn, table_name, columns):
+    """모든 컬럼의 NULL 수를 집계 쿼리 하나로 계산
+
+    반환값: (총 행 수, {컬럼명: NULL 수})
+    """
+    with conn.cursor() as cur:
+        select_list = ["COUNT(*)"] + [
+            f"COUNT(*) FILTER (WHERE {quote_ident(col, cur)} IS NULL)" for col in columns
+        ]
+        cur.execute(f"SELECT {', '.join(select_list)} FROM {quote_ident(table_name, cur)}")
+        total, *null_counts = cur.fetchone()
+    return total, dict(zip(columns, null_counts))
+
+
+def estimate_nulls(conn, table_names):
+    """pg_stats.null_frac와 pg_class.reltuples로 NULL 수 추정 (테이블을 읽지 않음, ANALYZE 기준)
+
+    반환값: {테이블명: (추정 행 수, {컬럼명: 추정 NULL 수})} (통계가 없는 테이블은 제외)
+    """
+    query = """
+        SELECT c.relname, c.reltuples::bigint, s.attname, s.null_frac
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_stats s ON s.schemaname = n.nspname AND s.tablename = c.relname
+        WHERE n.nspname = 'public' AND c.relname = ANY(%s)
+    """
+    with conn.cursor() as cur:
+        cur.execute(query, (list(table_names),))
+        rows = cur.fetchall()
+
+    estimates = {}
+    for table_name, reltuples, column_name, null_frac in rows:
+        total = max(reltuples, 0)
+        _, null_counts = estimates.setdefault(table_name, (total, {}))
+        null_counts[column_name] = round(null_frac * total)
+    return estimates
 
-    if not columns:
-        print(f"❌ 테이블 '{table_name}'을 찾을 수 없습니다.")
-        return
 
-    print(f"\n📊 NULL 비율: {table_name} (총 {total:,}행)")
+def print_null_report(table_name, columns, total, null_counts, estimated=False):
+    """NULL 비율 막대 출력 (NULL이 있는 컬럼만)"""
+    label = "추정 " if estimated else ""
+    print(f"\n📊 NULL 비율: {table_name} ({label}총 {total:,}행)")
     print("-" * 50)
 
     for col in columns:
-        with conn.cursor() as cur:
-            cur.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {col} IS NULL")
-            null_count = cur.fetchone()[0]
-
+        null_count = null_counts.get(col, 0)
         pct = (null_count / total * 100) if total > 0 else 0
         bar = "█" * int(pct / 5) + "░" * (20 - int(pct / 5))
 
@@ -592,12 +754,243 @@ def check_nulls(conn, table_name):
     print()
 
 
+def check_nulls(conn, table_name, estimate=False):
+    """컬럼별 NULL 비율 체크
+
+    table_name은 쉼표로 여러 개, %를 넣으면 패턴 (예: v2_%,v3_%, _는 글자 그대로).
+    테이블마다 집계 쿼리 한 번, estimate면 전체를 pg_stats 조회 한 번으로 처리.
+    """
+    table_names = [name.strip() for name in table_name.split(',') if name.strip()]
+    columns_by_table = fetch_table_columns(conn, table_names)
+    if not columns_by_table:
+        print(f"❌ 테이블 '{table_name}'을 찾을 수 없습니다.")
+        return
+
+    if estimate:
+        estimates = estimate_nulls(conn, columns_by_table)
+        for name, columns in columns_by_table.items():
+            if name not in estimates:
+                print(f"\n⚠️  {name}: pg_stats 통계 없음 (ANALYZE {name} 실행 필요)")
+                continue
+            total, null_counts = estimates[name]
+            print_null_report(name, columns, total, null_counts, estimated=True)
+        return
+
+    for name, columns in columns_by_table.items():
+        total, null_counts = count_nulls(conn, name, columns)
+        print_null_report(name, columns, total, null_counts)
+
+
+# ============================================
+# 전체 테이블 프로파일링 (병렬 연결)
+# ============================================
+
+# --analyze-all 기본 동시 연결 수
+ANALYZE_ALL_WORKERS = 4
+
+# --diff 시 변화로 보고할 기준
+PROFILE_NULL_DRIFT_PCT = 5.0        # NULL 비율 차이 (%p)
+PROFILE_DISTINCT_DRIFT_RATIO = 0.5  # DISTINCT 수 변화율
+PROFILE_ROW_DRIFT_RATIO = 0.1       # 행 수 변화율
+
+PROFILE_CSV_FIELDS = ['table', 'column', 'type', 'total_rows', 'nulls', 'null_pct',
+                      'distinct', 'min', 'max', 'avg', 'top']
+
+
+def list_public_tables(conn):
+    """public 스키마의 테이블명 목록"""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
+            ORDER BY table_name
+        """)
+        return [row[0] for row in cur.fetchall()]
+
+
+def profile_all_tables(table_names=None, workers=ANALYZE_ALL_WORKERS, sample_pct=None):
+    """모든 테이블을 연결 풀(ThreadedConnectionPool)로 동시에 프로파일링
+
+    반환값: {'generated_at', 'sample_pct', 'tables': {테이블명: profile_table 결과}},
+    연결 풀을 만들지 못하면 None
+    """
+    conn_string = load_keys().get('connection_string')
+    if not conn_string:
+        print("❌ 키 파일에 connection_string이 없습니다.")
+        return None
+
+    pool = None
+
+    def worker(table_name):
+        conn = pool.getconn()
+        try:
+            # 읽기만 하므로 테이블마다 트랜잭션을 열어 둘 필요 없음
+            conn.autocommit = True
+            started = time.perf_counter()
+            profile = profile_table(conn, table_name, sample_pct)
+            return profile, time.perf_counter() - started
+        finally:
+            pool.putconn(conn)
+
+    profiles = {}
+    try:
+        try:
+            pool = ThreadedConnectionPool(1, workers, conn_string)
+        except Exception as e:
+            print(f"❌ DB 연결 실패: {e}")
+            return None
+
+        if table_names is None:
+            conn = pool.getconn()
+            try:
+                table_names = list_public_tables(conn)
+            finally:
+                pool.putconn(conn)
+
+        print(f"\n📊 전체 테이블 분석: {len(table_names)}개 테이블, 연결 {workers}개"
+              + (f", TABLESAMPLE {sample_pct}%" if sample_pct else ""))
+        print("-" * 80)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(worker, name): name for name in table_names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    profile, elapsed = future.result()
+                except Exception as e:
+                    print(f"   ❌ {name}: {e}")
+                    continue
+                if profile is None:
+                    print(f"   ⚠️  {name}: 테이블을 찾을 수 없습니다")
+                    continue
+                profiles[name] = profile
+                print(f"   ✅ {name:<40} {profile['total_rows']:>10,}행 "
+                      f"{len(profile['columns']):>3}컬럼 {elapsed:6.2f}초")
+
+        print("-" * 80)
+        print(f"   완료: {len(profiles)}/{len(table_names)}개 테이블 ({time.perf_counter() - started:.2f}초)")
+    finally:
+        if pool is not None:
+            pool.closeall()
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'sample_pct': sample_pct,
+        'tables': {name: profiles[name] for name in sorted(profiles)},
+    }
+
+
+def flatten_profiles(result):
+    """프로파일 결과를 컬럼 단위 행 목록으로 변환 (CSV 저장/비교용)"""
+    rows = []
+    for table_name, profile in result['tables'].items():
+        total_rows = profile['total_rows']
+        for stats in profile['columns']:
+            rows.append({
+                'table': table_name,
+                'column': stats['name'],
+                'type': stats['type'],
+                'total_rows': total_rows,
+                'nulls': stats['nulls'],
+                'null_pct': round(stats['nulls'] / total_rows * 100, 2) if total_rows else 0.0,
+                'distinct': stats['distinct'],
+                'min': stats.get('min'),
+                'max': stats.get('max'),
+                'avg': stats.get('avg'),
+                'top': stats.get('top'),
+            })
+    return rows
+
+
+def save_profiles(result, output_file):
+    """프로파일 결과를 JSON 또는 CSV(확장자 기준)로 저장"""
+    if output_file.endswith('.csv'):
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=PROFILE_CSV_FIELDS)
+            writer.writeheader()
+            for row in flatten_profiles(result):
+                row['top'] = json.dumps(row['top'], ensure_ascii=False) if row['top'] is not None else ''
+                writer.writerow({key: '' if value is None else value for key, value in row.items()})
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2, default=json_serial)
+    print(f"\n💾 분석 결과 저장: {output_file}")
+
+
+def load_profile_rows(profile_file):
+    """저장된 프로파일(JSON/CSV)을 {(테이블, 컬럼): 행} 딕셔너리로 로드"""
+    if profile_file.endswith('.csv'):
+        with open(profile_file, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            for key in ('total_rows', 'nulls', 'distinct'):
+                row[key] = int(row[key])
+            row['null_pct'] = float(row['null_pct'])
+    else:
+        with open(profile_file, 'r', encoding='utf-8') as f:
+            rows = flatten_profiles(json.load(f))
+    return {(row['table'], row['column']): row for row in rows}
+
+
+def diff_profiles(previous_file, result):
+    """이전 프로파일 파일과 비교하여 데이터 품질 변화 출력
+
+    테이블/컬럼 추가·삭제, 타입 변경, 행 수·NULL 비율·DISTINCT 수의 큰 변화를 보고함.
+    반환값: 보고한 변화 수
+    """
+    before = load_profile_rows(previous_file)
+    after = {(row['table'], row['column']): row for row in flatten_profiles(result)}
+    changes = []
+
+    before_tables = {table: row['total_rows'] for (table, _), row in before.items()}
+    after_tables = {table: row['total_rows'] for (table, _), row in after.items()}
+    for table in sorted(set(before_tables) | set(after_tables)):
+        if table not in after_tables:
+            changes.append(f"➖ {table}: 테이블 없음")
+        elif table not in before_tables:
+            changes.append(f"➕ {table}: 새 테이블 ({after_tables[table]:,}행)")
+        else:
+            old_rows, new_rows = before_tables[table], after_tables[table]
+            if abs(new_rows - old_rows) > max(old_rows, 1) * PROFILE_ROW_DRIFT_RATIO:
+                changes.append(f"📈 {table}: 행 수 {old_rows:,} → {new_rows:,}")
+
+    for key in sorted(set(before) | set(after)):
+        table, column = key
+        if table not in before_tables or table not in after_tables:
+            continue
+        old, new = before.get(key), after.get(key)
+        name = f"{table}.{column}"
+        if new is None:
+            changes.append(f"➖ {name}: 컬럼 없음")
+            continue
+        if old is None:
+            changes.append(f"➕ {name}: 새 컬럼 ({new['type']})")
+            continue
+        if old['type'] != new['type']:
+            changes.append(f"🔀 {name}: 타입 {old['type']} → {new['type']}")
+        if abs(new['null_pct'] - old['null_pct']) >= PROFILE_NULL_DRIFT_PCT:
+            changes.append(f"⚠️  {name}: NULL {old['null_pct']:.1f}% → {new['null_pct']:.1f}%")
+        if abs(new['distinct'] - old['distinct']) > max(old['distinct'], 1) * PROFILE_DISTINCT_DRIFT_RATIO:
+            changes.append(f"🔢 {name}: DISTINCT {old['distinct']:,} → {new['distinct']:,}")
+
+    print(f"\n🔍 이전 분석과 비교: {previous_file}")
+    print("-" * 80)
+    if not changes:
+        print("   변화 없음")
+    for change in changes:
+        print(f"   {change}")
+    print()
+    return len(changes)
+
+
 # ============================================
 # 데이터 조회
 # ============================================
 
-def select_data(conn, table_name, fields=None, where=None, like=None, order=None, limit=10, as_json=False):
-    """데이터 조회"""
+def build_select_query(table_name, fields=None, where=None, like=None, order=None, limit=None):
+    """조회 옵션으로 SELECT 쿼리와 파라미터 생성"""
     field_str = ', '.join(fields) if fields else '*'
     query = f"SELECT {field_str} FROM {table_name}"
     params = []
@@ -628,6 +1021,13 @@ def select_data(conn, table_name, fields=None, where=None, like=None, order=None
     if limit:
         query += f" LIMIT {limit}"
 
+    return query, params
+
+
+def select_data(conn, table_name, fields=None, where=None, like=None, order=None, limit=10, as_json=False):
+    """데이터 조회"""
+    query, params = build_select_query(table_name, fields, where, like, order, limit)
+
     try:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(query, params)
@@ -675,6 +1075,77 @@ def select_data(conn, table_name, fields=None, where=None, like=None, order=None
         return None
 
 
+# 내보내기 시 서버 측 커서에서 한 번에 가져올 행 수
+EXPORT_ITERSIZE = 2000
+
+
+def export_csv_value(value):
+    """CSV 필드 값 변환 (NULL은 빈 값, JSON 컬럼은 JSON 문자열)"""
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=json_serial)
+    if isinstance(value, (datetime, date, datetime_time, memoryview, bytes, bytearray)):
+        return json_serial(value)
+    return value
+
+
+def export_data(conn, table_name, output_file, fields=None, where=None, like=None, order=None, limit=None):
+    """조회 결과를 파일로 스트리밍 저장 (.jsonl 또는 .csv)
+
+    이름 있는 커서(서버 측 커서)로 EXPORT_ITERSIZE 행씩 받아 바로 기록하므로
+    테이블 크기와 관계없이 메모리 사용량이 일정함.
+    """
+    if not output_file.endswith(('.jsonl', '.csv')):
+        print(f"❌ 지원하지 않는 내보내기 형식: {output_file} (.jsonl 또는 .csv)")
+        return None
+
+    query, params = build_select_query(table_name, fields, where, like, order, limit)
+    as_csv = output_file.endswith('.csv')
+    started = time.perf_counter()
+    row_count = 0
+
+    try:
+        with conn.cursor(name='supabase_query_export') as cur:
+            cur.itersize = EXPORT_ITERSIZE
+            cur.execute(query, params)
+
+            with open(output_file, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f) if as_csv else None
+                columns = None
+                for row in cur:
+                    # 서버 측 커서는 첫 행을 받은 뒤에 컬럼 정보가 채워짐
+                    if columns is None:
+                        columns = [desc[0] for desc in cur.description]
+                        if writer:
+                            writer.writerow(columns)
+                    if writer:
+                        writer.writerow([export_csv_value(value) for value in row])
+                    else:
+                        f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=json_serial))
+                        f.write('\n')
+                    row_count += 1
+                # 결과가 없어도 CSV 헤더는 남김
+                if writer and columns is None and cur.description:
+                    writer.writerow([desc[0] for desc in cur.description])
+        conn.commit()
+
+    except Exception as e:
+        conn.rollback()
+        # 중간에 끊긴 파일을 완전한 내보내기로 오인하지 않도록 삭제
+        Path(output_file).unlink(missing_ok=True)
+        print(f"❌ 내보내기 실패: {e}")
+        return None
+
+    elapsed = time.perf_counter() - started
+    size_mb = Path(output_file).stat().st_size / (1024 * 1024)
+    rate = row_count / elapsed if elapsed > 0 else 0
+    print(f"\n💾 내보내기 완료: {table_name} → {output_file}")
+    print(f"   {row_count:,}행, {size_mb:.1f}MB, {elapsed:.2f}초 ({rate:,.0f}행/초)")
+    print(f"   Query: {query}")
+    return row_count
+
+
 def execute_sql(conn, sql):
     """직접 SQL 실행"""
     try:
@@ -736,6 +1207,144 @@ def insert_data(conn, table_name, data_json):
         return False
 
 
+# 파일 일괄 INSERT/UPSERT 시 한 트랜잭션에 넣을 행 수
+BULK_BATCH_SIZE = 1000
+
+
+def iter_file_rows(file_path):
+    """행 파일(.jsonl / .json 배열 / .csv)에서 딕셔너리를 하나씩 읽기
+
+    CSV의 빈 값은 NULL로 처리. JSON 파일은 배열 또는 {"data": [...]} 형식이며,
+    전체를 읽지 않고 마이그레이션 백업과 같은 방식으로 원소를 하나씩 해석함.
+    """
+    if file_path.endswith('.csv'):
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                yield {key: (value if value != '' else None) for key, value in row.items()}
+    elif file_path.endswith('.jsonl'):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from JsonArrayReader(f)
+
+
+def build_bulk_insert_query(cur, table_name, columns, conflict=None, upsert=False):
+    """execute_values용 INSERT 쿼리 생성
+
+    conflict 컬럼이 있으면 upsert는 나머지 컬럼을 EXCLUDED 값으로 갱신, insert는 중복 행을 건너뜀.
+    """
+    query = (f"INSERT INTO {quote_ident(table_name, cur)} "
+             f"({', '.join(quote_ident(col, cur) for col in columns)}) VALUES %s")
+    if not conflict:
+        return query
+
+    conflict_str = ', '.join(quote_ident(col, cur) for col in conflict)
+    update_columns = [col for col in columns if col not in conflict]
+    if upsert and update_columns:
+        assignments = ', '.join(
+            f"{quote_ident(col, cur)} = EXCLUDED.{quote_ident(col, cur)}" for col in update_columns
+        )
+        return f"{query} ON CONFLICT ({conflict_str}) DO UPDATE SET {assignments}"
+    return f"{query} ON CONFLICT ({conflict_str}) DO NOTHING"
+
+
+def bulk_load_file(conn, table_name, file_path, upsert=False, conflict=None, batch_size=BULK_BATCH_SIZE):
+    """파일의 행을 execute_values로 일괄 INSERT/UPSERT (batch_size 행마다 커밋)
+
+    컬럼은 첫 행의 키 기준. upsert인데 conflict를 주지 않으면 기본키를 사용.
+    행에 없는 키는 NULL로 채우지 않고 컬럼에서 뺌 (INSERT는 기본값, UPSERT는 기존 값 유지).
+    UPSERT는 배치 안에서 충돌 키가 같은 행을 마지막 행 하나로 합침.
+    실패하면 해당 배치만 롤백하고 중단 (이전 배치는 이미 커밋됨).
+    """
+    mode = 'UPSERT' if upsert else 'INSERT'
+    if upsert and not conflict:
+        conflict = get_primary_key(conn, table_name)
+        if not conflict:
+            print(f"❌ 기본키가 없는 테이블입니다. --conflict로 충돌 기준 컬럼을 지정하세요: {table_name}")
+            return None
+
+    rows = iter_file_rows(file_path)
+    first = next(rows, None)
+    if first is None:
+        print(f"⚠️  파일에 행이 없습니다: {file_path}")
+        return 0
+
+    columns = list(first.keys())
+    missing = [col for col in (conflict or []) if col not in columns]
+    if missing:
+        print(f"❌ 충돌 기준 컬럼이 파일에 없습니다: {', '.join(missing)}")
+        return None
+
+    print(f"\n📥 {mode}: {file_path} → {table_name} ({len(columns)}개 컬럼, 배치 {batch_size:,}행"
+          + (f", 충돌 기준: {', '.join(conflict)}" if conflict else "") + ")")
+
+    def group_batch(batch):
+        """배치를 행에 있는 컬럼 구성별로 묶기 {컬럼 튜플: [값 튜플, ...]}"""
+        if upsert:
+            # 같은 충돌 키가 한 문장에 두 번 나오면 DO UPDATE가 실패하므로 마지막 행만 남김
+            latest = {}
+            for row in batch:
+                absent = [col for col in conflict if col not in row]
+                if absent:
+                    raise ValueError(f"충돌 기준 컬럼이 없는 행: {', '.join(absent)}")
+                key = tuple(row[col] for col in conflict)
+                latest.pop(key, None)
+                latest[key] = row
+            batch = latest.values()
+
+        groups = {}
+        for row in batch:
+            extra = set(row) - set(columns)
+            if extra:
+                raise ValueError(f"첫 행에 없는 컬럼: {', '.join(sorted(extra))}")
+            row_columns = tuple(col for col in columns if col in row)
+            # dict/list 값은 json/jsonb 컬럼용으로 변환
+            groups.setdefault(row_columns, []).append(tuple(
+                Json(row[col]) if isinstance(row[col], (dict, list)) else row[col]
+                for col in row_columns
+            ))
+        return groups
+
+    started = time.perf_counter()
+    total = 0
+    merged = 0
+    pending = [first]
+    try:
+        with conn.cursor() as cur:
+            queries = {}
+            while pending:
+                pending.extend(islice(rows, batch_size - len(pending)))
+                groups = group_batch(pending)
+                for row_columns, values in groups.items():
+                    if row_columns not in queries:
+                        queries[row_columns] = build_bulk_insert_query(cur, table_name, list(row_columns),
+                                                                       conflict, upsert)
+                    execute_values(cur, queries[row_columns], values, page_size=batch_size)
+                conn.commit()
+                total += len(pending)
+                merged += len(pending) - sum(len(values) for values in groups.values())
+                pending = list(islice(rows, 1))
+
+                elapsed = time.perf_counter() - started
+                rate = total / elapsed if elapsed > 0 else 0
+                print(f"   … {total:,}행 커밋 ({rate:,.0f}행/초)", end='\r', flush=True)
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\n❌ {mode} 실패 ({total:,}행까지 커밋됨, 다음 배치에서 중단): {e}")
+        return None
+
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed > 0 else 0
+    print(f"\n✅ {mode} 완료: {table_name} {total:,}행, {elapsed:.2f}초 ({rate:,.0f}행/초)")
+    if merged:
+        print(f"   ⚠️  배치 안의 중복 충돌 키 {merged:,}행은 마지막 행으로 합쳐짐")
+    return total
+
+
 def update_data(conn, table_name, data_json, where):
     """데이터 업데이트"""
     if not where:
@@ -831,7 +1440,7 @@ def main():
     parser.add_argument('--where', '-w', action='append', help='WHERE 조건')
     parser.add_argument('--like', help='LIKE 조건 (예: name=%%test%%)')
     parser.add_argument('--order', '-o', help='정렬 (예: created_at DESC)')
-    parser.add_argument('--limit', '-l', type=int, default=10, help='결과 수 (기본: 10)')
+    parser.add_argument('--limit', '-l', type=int, help='결과 수 (기본: 10, --export는 전체)')
 
     # 테이블/스키마 정보
     parser.add_argument('--list-tables', action='store_true', help='테이블 목록')
@@ -846,8 +1455,15 @@ def main():
 
     # 데이터 분석
     parser.add_argument('--analyze', '-a', help='테이블 데이터 분석')
+    parser.add_argument('--analyze-all', action='store_true', help='모든 테이블 동시 분석')
+    parser.add_argument('--workers', type=int, default=ANALYZE_ALL_WORKERS,
+                        help=f'--analyze-all 동시 연결 수 (기본: {ANALYZE_ALL_WORKERS})')
+    parser.add_argument('--output', help='--analyze-all 결과 파일 (.json 또는 .csv)')
+    parser.add_argument('--diff', help='--analyze-all 결과와 비교할 이전 결과 파일')
     parser.add_argument('--distinct', '-d', help='고유값 목록 (테이블.컬럼)')
-    parser.add_argument('--null-check', help='NULL 비율 체크')
+    parser.add_argument('--null-check', help='NULL 비율 체크 (쉼표 구분, %%로 패턴: v2_%%,v3_%%)')
+    parser.add_argument('--estimate', action='store_true', help='NULL 비율을 pg_stats 통계로 추정 (테이블 스캔 없음)')
+    parser.add_argument('--sample', type=float, help='분석 시 TABLESAMPLE 비율 (%%, 근사값)')
 
     # SQL
     parser.add_argument('--sql', help='직접 SQL 실행')
@@ -856,9 +1472,15 @@ def main():
     parser.add_argument('--insert', help='INSERT (JSON)')
     parser.add_argument('--update', help='UPDATE (JSON)')
     parser.add_argument('--delete', action='store_true', help='DELETE')
+    parser.add_argument('--insert-file', help='파일 행 일괄 INSERT (.jsonl / .json / .csv)')
+    parser.add_argument('--upsert-file', help='파일 행 일괄 UPSERT (.jsonl / .json / .csv)')
+    parser.add_argument('--conflict', help='충돌 기준 컬럼 (쉼표 구분, UPSERT 기본: 기본키)')
+    parser.add_argument('--batch-size', type=int, default=BULK_BATCH_SIZE,
+                        help=f'파일 INSERT/UPSERT 배치(트랜잭션) 크기 (기본: {BULK_BATCH_SIZE})')
 
     # 출력
     parser.add_argument('--json', action='store_true', help='JSON 출력')
+    parser.add_argument('--export', help='조회 결과를 파일로 스트리밍 저장 (.jsonl 또는 .csv)')
 
     args = parser.parse_args()
 
@@ -867,6 +1489,17 @@ def main():
         print(__doc__)
         return
 
+    # 전체 분석은 자체 연결 풀을 사용
+    if args.analyze_all:
+        result = profile_all_tables(workers=max(1, args.workers), sample_pct=args.sample)
+        if result is None:
+            return
+        if args.output:
+            save_profiles(result, args.output)
+        if args.diff:
+            diff_profiles(args.diff, result)
+        return
+
     conn = get_connection()
     print("✅ Supabase 연결 성공")
 
@@ -910,13 +1543,13 @@ def main():
 
         # 데이터 분석
         if args.analyze:
-            analyze_table(conn, args.analyze)
+            analyze_table(conn, args.analyze, args.sample)
             return
         if args.distinct:
             show_distinct_values(conn, args.distinct)
             return
         if args.null_check:
-            check_nulls(conn, args.null_check)
+            check_nulls(conn, args.null_check, args.estimate)
             return
 
         # SQL
@@ -939,10 +1572,20 @@ def main():
         if args.delete:
             delete_data(conn, args.table, args.where)
             return
+        if args.insert_file or args.upsert_file:
+            conflict = [col.strip() for col in args.conflict.split(',')] if args.conflict else None
+            bulk_load_file(conn, args.table, args.upsert_file or args.insert_file,
+                           upsert=bool(args.upsert_file), conflict=conflict,
+                           batch_size=max(1, args.batch_size))
+            return
 
         # SELECT
         fields = args.fields.split(',') if args.fields else None
-        select_data(conn, args.table, fields, args.where, args.like, args.order, args.limit, args.json)
+        if args.export:
+            export_data(conn, args.table, args.export, fields, args.where, args.like, args.order, args.limit)
+            return
+        limit = args.limit if args.limit is not None else 10
+        select_data(conn, args.table, fields, args.where, args.like, args.order, limit, args.json)
 
     finally:
         conn.close()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+benchmark_migration의 합성 값 생성기 테스트 (DB 없이 실행)
+
+사용법:
+    python test_benchmark_migration.py
+"""
+
+import json
+import random
+import unittest
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from pathlib import Path
+
+import benchmark_migration as bench
+import full_migration as fm
+
+SCHEMA_DIR = Path(__file__).parent / 'cafe24_backup' / 'schemas'
+
+
+def make_column(mysql_type: str, key: str = '', null: str = 'NO') -> dict:
+    return {'Field': 'col', 'Type': mysql_type, 'Key': key, 'Null': null}
+
+
+def generate(mysql_type: str, count: int = 200, **kwargs) -> list:
+    generator = bench.make_value_generator(make_column(mysql_type, **kwargs), random.Random(0))
+    return [generator(i) for i in range(count)]
+
+
+class ValueGeneratorTest(unittest.TestCase):
+
+    def test_boolean_only_for_tinyint_1(self):
+        self.assertTrue(set(generate('tinyint(1)')) <= {0, 1})
+        values = generate('tinyint(4)')
+        self.assertTrue(all(0 <= value <= 127 for value in values))
+        self.assertGreater(len(set(values)), 2)
+
+    def test_integer_primary_key_is_sequential(self):
+        self.assertEqual(generate('int(11)', count=5, key='PRI'), [1, 2, 3, 4, 5])
+
+    def test_varchar_fits_length(self):
+        for value in generate('varchar(5)'):
+            self.assertTrue(1 <= len(value) <= 5)
+        keys = generate('varchar(3)', count=50, key='PRI')
+        self.assertTrue(all(len(value) <= 3 for value in keys))
+
+    def test_decimal_fits_precision(self):
+        for value in generate('decimal(5,2)'):
+            self.assertIsInstance(value, Decimal)
+            self.assertLessEqual(abs(value.as_tuple().exponent), 2)
+            self.assertLess(value, Decimal('1000'))
+
+    def test_enum_uses_allowed_values(self):
+        self.assertTrue(set(generate("enum('Y','N')")) <= {'Y', 'N'})
+
+    def test_date_and_time_types(self):
+        self.assertTrue(all(isinstance(value, date) for value in generate('date')))
+        self.assertTrue(all(isinstance(value, datetime) for value in generate('datetime')))
+        self.assertTrue(all(isinstance(value, dt_time) for value in generate('time')))
+
+    def test_json_is_valid(self):
+        for value in generate('json', count=10):
+            json.loads(value)
+
+    def test_nullable_columns_get_nulls(self):
+        self.assertIn(None, generate('int(11)', null='YES'))
+        self.assertNotIn(None, generate('int(11)', null='NO'))
+        self.assertNotIn(None, generate('int(11)', null='YES', key='PRI'))
+
+    def test_same_seed_same_values(self):
+        self.assertEqual(generate('varchar(20)'), generate('varchar(20)'))
+
+    def test_real_schemas(self):
+        schemas = sorted(SCHEMA_DIR.glob('*_schema.json'))
+        if not schemas:
+            self.skipTest('스키마 파일 없음')
+        for path in schemas:
+            with open(path, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+            for col in schema['columns']:
+                with self.subTest(table=schema['table_name'], column=col['Field']):
+                    generator = bench.make_value_generator(col, random.Random(0))
+                    value = generator(0)
+                    if col['Null'] != 'YES' or col['Key'] == 'PRI':
+                        self.assertIsNotNone(value)
+                    base, args, _ = fm.parse_mysql_type(col['Type'])
+                    if base in ('char', 'varchar') and args and value is not None:
+                        self.assertLessEqual(len(value), int(args[0]))
+
+
+class RssSamplerTest(unittest.TestCase):
+
+    def test_peak_covers_stage_allocation(self):
+        if fm.current_rss_mb() is None:
+            self.skipTest('/proc/self/statm 없음')
+        with bench.RssSampler() as sampler:
+            block = bytearray(64 * 1024 * 1024)
+            block[::4096] = b'x' * len(block[::4096])
+        del block
+        self.assertGreaterEqual(sampler.peak_mb - sampler.start_mb, 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
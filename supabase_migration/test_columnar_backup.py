@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+컬럼 압축 백업(.cols.json.gz) 테스트 (행 그룹 단위 기록/복원, 이전 형식 읽기, DB 없이 실행)
+
+사용법:
+    python test_columnar_backup.py
+"""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import mock
+
+import full_migration as fm
+
+SCHEMA = {
+    'table_name': 'sample',
+    'columns': [
+        {'Field': 'id', 'Type': 'int(11)', 'Key': 'PRI'},
+        {'Field': 'price', 'Type': 'decimal(10,2)', 'Key': ''},
+        {'Field': 'day', 'Type': 'date', 'Key': ''},
+        {'Field': 'created', 'Type': 'datetime', 'Key': ''},
+        {'Field': 'memo', 'Type': 'varchar(20)', 'Key': ''},
+    ],
+}
+
+
+def make_rows(count: int) -> list:
+    return [
+        (i, Decimal(f'{i}.50'), date(2024, 1, 1 + i % 28), datetime(2024, 1, 1, i % 24, 30), None if i % 3 else f'메모 {i}')
+        for i in range(count)
+    ]
+
+
+class FakeCursor:
+    """SSCursor 대역 (fetchmany로 나눠 돌려준 횟수를 기록)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.position = 0
+        self.fetches = 0
+        self.description = [(col['Field'],) for col in SCHEMA['columns']]
+
+    def execute(self, query):
+        pass
+
+    def fetchmany(self, size):
+        chunk = self.rows[self.position:self.position + size]
+        self.position += len(chunk)
+        self.fetches += 1
+        return chunk
+
+    def close(self):
+        pass
+
+
+class FakeDb:
+    def __init__(self, rows):
+        self.cursor_obj = FakeCursor(rows)
+
+    def cursor(self, cursor_class=None):
+        return self.cursor_obj
+
+
+class ColumnarBackupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='columnar_test_')
+        schema_dir = os.path.join(self.work_dir, 'schemas')
+        os.makedirs(schema_dir)
+        with open(os.path.join(schema_dir, 'sample_schema.json'), 'w', encoding='utf-8') as f:
+            json.dump(SCHEMA, f)
+        self.patches = [
+            mock.patch.object(fm, 'DATA_DIR', self.work_dir),
+            mock.patch.object(fm, 'SCHEMA_DIR', schema_dir),
+            mock.patch.object(fm, 'BACKUP_CHUNK_SIZE', 4),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.data_file = os.path.join(self.work_dir, 'sample_data.cols.json.gz')
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def expected_rows(self, rows):
+        columns = [col['Field'] for col in SCHEMA['columns']]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def test_backup_round_trip_in_row_groups(self):
+        rows = make_rows(10)
+        db = FakeDb(rows)
+        with mock.patch('builtins.print'):
+            self.assertEqual(fm.backup_table_data_columnar(db, 'sample'), 10)
+
+        with gzip.open(self.data_file, 'rt', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines[0]['format'], fm.COLUMNAR_FORMAT_VERSION)
+        self.assertEqual([line['rows'] for line in lines[1:-1]], [4, 4, 2])
+        self.assertEqual(lines[-1], {'row_count': 10})
+
+        self.assertEqual(list(fm.iter_columnar_data_file(self.data_file)), self.expected_rows(rows))
+
+    def test_empty_table(self):
+        with mock.patch('builtins.print'):
+            self.assertEqual(fm.backup_table_data_columnar(FakeDb([]), 'sample'), 0)
+        self.assertEqual(list(fm.iter_columnar_data_file(self.data_file)), [])
+
+    def test_snapshot_round_trip(self):
+        data = self.expected_rows(make_rows(9))
+        fm.save_columnar_snapshot(self.data_file, 'sample', data)
+        self.assertEqual(fm.read_columnar_data_file(self.data_file), data)
+
+    def test_reads_legacy_single_document(self):
+        rows = make_rows(3)
+        columns = [col['Field'] for col in SCHEMA['columns']]
+        with gzip.open(self.data_file, 'wt', encoding='utf-8') as f:
+            json.dump({
+                'format': fm.COLUMNAR_LEGACY_VERSION,
+                'table_name': 'sample',
+                'row_count': len(rows),
+                'columns': columns,
+                'types': [col['Type'] for col in SCHEMA['columns']],
+                'data': [[fm.serialize_value(value) for value in values] for values in zip(*rows)],
+            }, f, ensure_ascii=False, separators=(',', ':'), default=str)
+        self.assertEqual(list(fm.iter_columnar_data_file(self.data_file)), self.expected_rows(rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+JsonArrayReader 테스트 (블록 경계에 걸린 값도 json.load와 같게 읽는지 확인)
+
+사용법:
+    python test_json_array_reader.py
+"""
+
+import io
+import json
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import json_stream
+
+BACKUP_DATA_DIR = Path(__file__).parent / 'cafe24_backup' / 'data'
+
+
+def read_with_block_size(text: str, block_size: int) -> list:
+    """지정한 블록 크기로 JsonArrayReader를 돌려 행 목록 반환"""
+    with mock.patch.object(json_stream, 'JSON_READ_BLOCK_SIZE', block_size):
+        return list(json_stream.JsonArrayReader(io.StringIO(text)))
+
+
+class JsonArrayReaderTest(unittest.TestCase):
+
+    def assert_same_as_json_load(self, text: str, block_sizes=range(1, 8)):
+        expected = json.loads(text).get('data', [])
+        for block_size in block_sizes:
+            with self.subTest(block_size=block_size):
+                self.assertEqual(read_with_block_size(text, block_size), expected)
+
+    def test_numbers_split_at_block_boundary(self):
+        self.assert_same_as_json_load('{"data":[1, 2.5e3]}')
+        self.assert_same_as_json_load('{"data": [12345, -0.125, 6E-2, 100]}')
+
+    def test_rows_and_other_keys(self):
+        text = json.dumps({
+            'table_name': 'sample',
+            'columns': ['id', 'price', 'memo'],
+            'data': [
+                {'id': 1, 'price': 2.5, 'memo': 'a, b ] c'},
+                {'id': 22, 'price': 1e10, 'memo': None},
+                {'id': 333, 'price': -3.75, 'memo': '한글 "인용"'},
+            ],
+            'row_count': 3,
+        }, ensure_ascii=False, indent=2)
+        self.assert_same_as_json_load(text)
+
+    def test_top_level_array(self):
+        text = '[{"id": 1, "v": 2.5}, {"id": 20, "v": null}]'
+        for block_size in range(1, 8):
+            with self.subTest(block_size=block_size):
+                self.assertEqual(read_with_block_size(text, block_size), json.loads(text))
+
+    def test_empty_and_missing_array(self):
+        self.assert_same_as_json_load('{"data": []}')
+        self.assert_same_as_json_load('{"table_name": "sample"}')
+
+    def test_backup_files(self):
+        files = sorted(BACKUP_DATA_DIR.glob('*_data.json'))
+        if not files:
+            self.skipTest('백업 데이터 파일 없음')
+        # 작은 파일 몇 개만 작은 블록 크기로 비교 (블록 1자는 너무 느리므로 제외)
+        for path in sorted(files, key=lambda p: p.stat().st_size)[:5]:
+            text = path.read_text(encoding='utf-8')
+            with self.subTest(file=path.name):
+                self.assert_same_as_json_load(text, block_sizes=(3, 5, 7, 64))
+
+
+if __name__ == '__main__':
+    unittest.main()
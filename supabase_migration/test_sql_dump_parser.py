@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+SQL 덤프(<테이블>_data.sql) 파서 테스트 (이스케이프, 여러 줄 문자열, 실제 덤프 파일 왕복, DB 없이 실행)
+
+사용법:
+    python test_sql_dump_parser.py
+"""
+
+import io
+import re
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+import full_migration as fm
+
+BACKUP_DATA_DIR = Path(__file__).parent / 'cafe24_backup' / 'data'
+
+# 문자열 리터럴 본문 → unescape_mysql_string 결과
+UNESCAPE_CASES = {
+    'plain': 'plain',
+    "it''s": "it's",
+    "it\\'s": "it's",
+    "\\'\\'quoted\\'\\'": "''quoted''",
+    'C:\\\\temp': 'C:\\temp',
+    '\\\\\\\\': '\\\\',
+    '\\\\n': '\\n',
+    'a\\nb\\rc\\td': 'a\nb\rc\td',
+    '\\0\\b\\Z': '\0\b\x1a',
+    '100\\%': '100\\%',
+    'a\\_b': 'a\\_b',
+    '\\"': '"',
+    '한글 \\\'인용\\\'': "한글 '인용'",
+    '': '',
+}
+
+# 따옴표 없는 값 → parse_sql_dump_word 결과
+WORD_CASES = {
+    'NULL': None,
+    'null': None,
+    'TRUE': True,
+    'false': False,
+    '0': 0,
+    '-42': -42,
+    '12345678901234567890': 12345678901234567890,
+    '1.50': Decimal('1.50'),
+    '-0.125': Decimal('-0.125'),
+    '1e3': Decimal('1e3'),
+}
+
+ROW_COUNT_PATTERN = re.compile(r'^-- Row Count: (\d+)$', re.MULTILINE)
+
+
+def dump_literal(value) -> str:
+    """덤프 파일과 같은 방식(백슬래시 이스케이프)으로 값을 SQL 리터럴로 되돌림"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, str):
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    return str(value)
+
+
+def rebuild_insert(table_name: str, columns: list, rows: list) -> str:
+    column_list = ', '.join(f'`{col}`' for col in columns)
+    values = ', '.join('(' + ', '.join(dump_literal(value) for value in row) + ')' for row in rows)
+    return f'INSERT INTO `{table_name}` ({column_list}) VALUES {values};'
+
+
+class UnescapeMysqlStringTest(unittest.TestCase):
+
+    def test_unescape_cases(self):
+        for body, expected in UNESCAPE_CASES.items():
+            with self.subTest(body=body):
+                self.assertEqual(fm.unescape_mysql_string(body), expected)
+
+    def test_parse_sql_dump_word(self):
+        for word, expected in WORD_CASES.items():
+            with self.subTest(word=word):
+                self.assertEqual(fm.parse_sql_dump_word(word), expected)
+
+    def test_unknown_word_is_rejected(self):
+        with self.assertRaises(ValueError):
+            fm.parse_sql_dump_word('NOW()')
+
+
+class ParseSqlDumpInsertTest(unittest.TestCase):
+
+    def test_multi_row_values(self):
+        statement = ("INSERT INTO `Board` (`id`, `title`, `price`, `memo`) VALUES "
+                     "(1, 'a', 1.50, NULL), (-2, 'it''s', 0, 'x\\'y');")
+        self.assertEqual(fm.parse_sql_dump_insert(statement), ('Board', ['id', 'title', 'price', 'memo'], [
+            (1, 'a', Decimal('1.50'), None),
+            (-2, "it's", 0, "x'y"),
+        ]))
+
+    def test_punctuation_inside_strings(self):
+        statement = "INSERT INTO `t` (`a`, `b`) VALUES ('x); (y', 'a;b,c');"
+        self.assertEqual(fm.parse_sql_dump_insert(statement)[2], [('x); (y', 'a;b,c')])
+
+    def test_backslash_before_closing_quote(self):
+        statement = "INSERT INTO `t` (`a`, `b`) VALUES ('C:\\\\', 'x');"
+        self.assertEqual(fm.parse_sql_dump_insert(statement)[2], [('C:\\', 'x')])
+
+    def test_non_insert_statements(self):
+        for statement in ('SET FOREIGN_KEY_CHECKS=0;', 'TRUNCATE TABLE `Board`;'):
+            with self.subTest(statement=statement):
+                self.assertIsNone(fm.parse_sql_dump_insert(statement))
+
+    def test_unclosed_string_is_incomplete(self):
+        with self.assertRaises(fm.IncompleteSqlStatement):
+            fm.parse_sql_dump_insert("INSERT INTO `t` (`a`) VALUES ('a;\n")
+        with self.assertRaises(fm.IncompleteSqlStatement):
+            fm.parse_sql_dump_insert("INSERT INTO `t` (`a`) VALUES ('it\\'s;")
+
+    def test_column_count_mismatch(self):
+        with self.assertRaises(ValueError):
+            fm.parse_sql_dump_insert("INSERT INTO `t` (`a`, `b`) VALUES (1);")
+
+
+class IterSqlDumpInsertsTest(unittest.TestCase):
+
+    def test_multi_line_strings(self):
+        dump = (
+            "-- Table: t\n"
+            "-- Row Count: 2\n"
+            "\n"
+            "SET FOREIGN_KEY_CHECKS=0;\n"
+            "INSERT INTO `t` (`id`, `memo`) VALUES (1, '첫 줄;\r\n"
+            "둘째 줄 \\'인용\\'\n"
+            "-- 주석 아님;\n"
+            "끝');\n"
+            "INSERT INTO `t` (`id`, `memo`) VALUES (2, NULL);\n"
+        )
+        rows = [row for _, _, rows in fm.iter_sql_dump_inserts(io.StringIO(dump, newline='')) for row in rows]
+        self.assertEqual(rows, [(1, "첫 줄;\r\n둘째 줄 '인용'\n-- 주석 아님;\n끝"), (2, None)])
+
+    def test_truncated_dump(self):
+        dump = "INSERT INTO `t` (`id`, `memo`) VALUES (1, 'never closed);\n"
+        with self.assertRaises(ValueError):
+            list(fm.iter_sql_dump_inserts(io.StringIO(dump)))
+
+    def test_backup_files_round_trip(self):
+        files = sorted(BACKUP_DATA_DIR.glob('*_data.sql'))
+        if not files:
+            self.skipTest('SQL 덤프 파일 없음')
+        for path in files:
+            with self.subTest(file=path.name):
+                text = path.read_bytes().decode('utf-8')
+                statements = iter(re.findall(r'^INSERT INTO .*?;$(?=\n(?:INSERT INTO |\n|\Z)|\Z)',
+                                             text, re.MULTILINE | re.DOTALL))
+                row_count = 0
+                with open(path, encoding='utf-8', newline='') as f:
+                    for table_name, columns, rows in fm.iter_sql_dump_inserts(f):
+                        # 해석한 값을 같은 이스케이프 규칙으로 되돌리면 원래 문장과 글자 단위로 같아야 함
+                        self.assertEqual(rebuild_insert(table_name, columns, rows), next(statements))
+                        row_count += len(rows)
+                self.assertIsNone(next(statements, None))
+                header = ROW_COUNT_PATTERN.search(text)
+                if header:
+                    self.assertEqual(row_count, int(header.group(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+MySQL → PostgreSQL 타입 변환 테스트 (MYSQL_TYPE_MAP 항목별, TYPE_OVERRIDES, 캐시, DB 없이 실행)
+
+사용법:
+    python test_type_mapping.py
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import full_migration as fm
+
+# MySQL 타입 문자열 → 기대하는 PostgreSQL 타입
+TYPE_CASES = {
+    # 정수 (unsigned는 한 단계 큰 타입, tinyint(1)만 BOOLEAN)
+    'tinyint(1)': 'BOOLEAN',
+    'tinyint(4)': 'SMALLINT',
+    'tinyint(3) unsigned': 'SMALLINT',
+    'tinyint': 'SMALLINT',
+    'TINYINT(1)': 'BOOLEAN',
+    'smallint(6)': 'SMALLINT',
+    'smallint(5) unsigned': 'INTEGER',
+    'mediumint(9)': 'INTEGER',
+    'mediumint(8) unsigned': 'INTEGER',
+    'int(11)': 'INTEGER',
+    'int(10) unsigned': 'BIGINT',
+    'int unsigned zerofill': 'BIGINT',
+    'integer': 'INTEGER',
+    'integer unsigned': 'BIGINT',
+    'bigint(20)': 'BIGINT',
+    'bigint(20) unsigned': 'NUMERIC(20)',
+    'year(4)': 'INTEGER',
+    'bit(1)': 'BOOLEAN',
+    'bit': 'BOOLEAN',
+    'bit(8)': 'BIT VARYING(8)',
+    'bool': 'BOOLEAN',
+    'boolean': 'BOOLEAN',
+    # 실수/고정소수점
+    'decimal(10,2)': 'NUMERIC(10,2)',
+    'decimal(20)': 'NUMERIC(20)',
+    'decimal': 'NUMERIC',
+    'numeric(5,3)': 'NUMERIC(5,3)',
+    'numeric': 'NUMERIC',
+    'float': 'REAL',
+    'float unsigned': 'REAL',
+    'double': 'DOUBLE PRECISION',
+    'real': 'DOUBLE PRECISION',
+    # 문자열
+    'char(3)': 'CHAR(3)',
+    'char': 'CHAR',
+    'varchar(255)': 'VARCHAR(255)',
+    'varchar': 'VARCHAR',
+    'tinytext': 'TEXT',
+    'text': 'TEXT',
+    'mediumtext': 'TEXT',
+    'longtext': 'TEXT',
+    # enum/set: 가장 긴 값 / 쉼표 포함 전체 길이
+    "enum('Y','N')": 'VARCHAR(1)',
+    "enum('예약','취소됨','it''s')": 'VARCHAR(4)',
+    "enum('a,b','c')": 'VARCHAR(3)',
+    "enum()": 'VARCHAR(1)',
+    "set('a','bb','ccc')": 'VARCHAR(8)',
+    "set('')": 'VARCHAR(1)',
+    # 날짜/시간 (소수점 초 정밀도 유지)
+    'date': 'DATE',
+    'time': 'TIME',
+    'time(3)': 'TIME(3)',
+    'datetime': 'TIMESTAMP',
+    'datetime(6)': 'TIMESTAMP(6)',
+    'timestamp': 'TIMESTAMP',
+    'timestamp(3)': 'TIMESTAMP(3)',
+    # 바이너리/기타
+    'binary(16)': 'BYTEA',
+    'varbinary(255)': 'BYTEA',
+    'tinyblob': 'BYTEA',
+    'blob': 'BYTEA',
+    'mediumblob': 'BYTEA',
+    'longblob': 'BYTEA',
+    'json': 'JSONB',
+}
+
+# MySQL 타입 문자열 → parse_mysql_type 결과
+PARSE_CASES = {
+    'int(10) unsigned': ('int', ('10',), True),
+    '  INT(11)  ': ('int', ('11',), False),
+    'decimal(10, 2)': ('decimal', ('10', '2'), False),
+    'double': ('double', (), False),
+    "enum('a','b')": ('enum', ('a', 'b'), False),
+    "enum('it''s','x,y')": ('enum', ("it's", 'x,y'), False),
+    "set('')": ('set', ('',), False),
+    'bigint(20) UNSIGNED ZEROFILL': ('bigint', ('20',), True),
+    'datetime(6)': ('datetime', ('6',), False),
+}
+
+
+def make_column(mysql_type: str, extra: str = '', null: str = 'YES', field: str = 'col') -> dict:
+    return {'Field': field, 'Type': mysql_type, 'Null': null, 'Key': '', 'Default': None, 'Extra': extra}
+
+
+class MysqlTypeMapTest(unittest.TestCase):
+
+    def test_type_cases(self):
+        for mysql_type, expected in TYPE_CASES.items():
+            with self.subTest(mysql_type=mysql_type):
+                self.assertEqual(fm.mysql_type_to_postgresql(mysql_type), expected)
+
+    def test_every_map_entry_has_a_case(self):
+        bases = {fm.parse_mysql_type(mysql_type)[0] for mysql_type in TYPE_CASES}
+        self.assertEqual(set(fm.MYSQL_TYPE_MAP) - bases, set())
+
+    def test_parse_mysql_type(self):
+        for mysql_type, expected in PARSE_CASES.items():
+            with self.subTest(mysql_type=mysql_type):
+                self.assertEqual(fm.parse_mysql_type(mysql_type), expected)
+
+    def test_unknown_type_falls_back_to_text(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(fm.mysql_type_to_postgresql('geometry_unknown_test'), 'TEXT')
+        self.assertIn('geometry_unknown_test', output.getvalue())
+
+    def test_results_are_cached_per_type_string(self):
+        fm.mysql_type_to_postgresql.cache_clear()
+        with mock.patch.object(fm, 'parse_mysql_type', wraps=fm.parse_mysql_type) as parse:
+            for _ in range(3):
+                self.assertEqual(fm.mysql_type_to_postgresql('int(10) unsigned'), 'BIGINT')
+            self.assertEqual(parse.call_count, 1)
+        info = fm.mysql_type_to_postgresql.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        fm.mysql_type_to_postgresql.cache_clear()
+
+
+class TypeOverridesTest(unittest.TestCase):
+
+    def setUp(self):
+        fm.TYPE_OVERRIDES['override_test'] = {'flag': 'SMALLINT', 'memo': 'TEXT'}
+
+    def tearDown(self):
+        del fm.TYPE_OVERRIDES['override_test']
+
+    def test_override_wins_case_insensitively(self):
+        col = make_column('tinyint(1)', field='FLAG')
+        self.assertEqual(fm.get_postgresql_column_type('Override_Test', col), 'SMALLINT')
+        self.assertEqual(fm.get_postgresql_column_type('other_table', col), 'BOOLEAN')
+        self.assertEqual(fm.get_postgresql_column_type(None, col), 'BOOLEAN')
+
+    def test_override_used_in_ddl_and_converter(self):
+        col = make_column('varchar(10)', field='memo')
+        self.assertEqual(fm.build_column_definition(col, 'override_test')['definition'], 'memo TEXT')
+        flag = make_column('tinyint(1)', field='flag')
+        self.assertIs(fm.get_column_converter('override_test', flag), fm._convert_plain_value)
+        self.assertIs(fm.get_column_converter('other_table', flag), fm._convert_boolean_value)
+
+
+class ColumnDefinitionTest(unittest.TestCase):
+
+    def test_auto_increment_serial_types(self):
+        cases = {
+            'int(11)': 'SERIAL',
+            'bigint(20)': 'BIGSERIAL',
+            'smallint(6)': 'SMALLSERIAL',
+            'mediumint(9)': 'SERIAL',
+        }
+        for mysql_type, expected in cases.items():
+            with self.subTest(mysql_type=mysql_type):
+                definition = fm.build_column_definition(make_column(mysql_type, 'auto_increment', 'NO'), 't')
+                self.assertTrue(definition['serial'])
+                self.assertEqual(definition['definition'], f'col {expected} NOT NULL')
+
+    def test_unsigned_int_auto_increment_uses_bigserial(self):
+        definition = fm.build_column_definition(make_column('int(10) unsigned', 'auto_increment', 'NO'), 't')
+        self.assertEqual(definition['definition'], 'col BIGSERIAL NOT NULL')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+--verify 해시 식 테스트 (타입별로 MySQL/PostgreSQL 텍스트화 식이 맞게 만들어지는지 확인, DB 없이 실행)
+
+사용법:
+    python test_verify_expressions.py
+"""
+
+import unittest
+
+import full_migration as fm
+
+ZERO_CHECK = "IN ('0000-00-00', '0000-00-00 00:00:00', '00:00:00')"
+
+# MySQL 타입 → (MySQL 식, PostgreSQL 식) 또는 None (검증 제외)
+VERIFY_CASES = {
+    'tinyint(1)': ('CAST((`c` <> 0) AS CHAR)', 'c::int::text'),
+    'bit(1)': ('CAST((`c` <> 0) AS CHAR)', 'c::int::text'),
+    'bool': ('CAST((`c` <> 0) AS CHAR)', 'c::int::text'),
+    'boolean': ('CAST((`c` <> 0) AS CHAR)', 'c::int::text'),
+    'time': ('CAST(SEC_TO_TIME(MOD(MOD(TIME_TO_SEC(`c`), 86400) + 86400, 86400)) AS CHAR)', 'c::text'),
+    'time(3)': None,
+    'datetime': ("IF(CAST(`c` AS CHAR) LIKE '0000-00-00%', NULL, DATE_FORMAT(`c`, '%Y-%m-%d %H:%i:%s.%f'))",
+                 "to_char(c, 'YYYY-MM-DD HH24:MI:SS.US')"),
+    'datetime(6)': ("IF(CAST(`c` AS CHAR) LIKE '0000-00-00%', NULL, DATE_FORMAT(`c`, '%Y-%m-%d %H:%i:%s.%f'))",
+                    "to_char(c, 'YYYY-MM-DD HH24:MI:SS.US')"),
+    'timestamp(3)': ("IF(CAST(`c` AS CHAR) LIKE '0000-00-00%', NULL, DATE_FORMAT(`c`, '%Y-%m-%d %H:%i:%s.%f'))",
+                     "to_char(c, 'YYYY-MM-DD HH24:MI:SS.US')"),
+    'binary(16)': ('HEX(`c`)', "upper(encode(c, 'hex'))"),
+    'tinyblob': ('HEX(`c`)', "upper(encode(c, 'hex'))"),
+    'blob': ('HEX(`c`)', "upper(encode(c, 'hex'))"),
+    'mediumblob': ('HEX(`c`)', "upper(encode(c, 'hex'))"),
+    'longblob': ('HEX(`c`)', "upper(encode(c, 'hex'))"),
+    'varbinary(16)': ('HEX(`c`)', "upper(encode(c, 'hex'))"),
+    'bit(8)': ("LPAD(BIN(`c`), 8, '0')", "lpad(c::text, 8, '0')"),
+    'float': None,
+    'double': None,
+    'real': None,
+    'json': None,
+}
+
+# 기본 규칙(CAST AS CHAR ↔ ::text, 0000-00-00은 NULL)으로 비교하는 타입
+GENERIC_TYPES = [
+    'tinyint(4)', 'smallint(6)', 'smallint unsigned', 'mediumint(9)', 'int(11)', 'int(10) unsigned',
+    'integer', 'bigint(20)', 'bigint unsigned', 'year', 'decimal(10,2)', 'numeric', 'char(3)',
+    'varchar(50)', 'tinytext', 'text', 'mediumtext', 'longtext', "enum('Y','N')", "set('a','b')", 'date',
+]
+
+
+def column_texts(mysql_type: str, table_name: str = 't'):
+    col = {'Field': 'C', 'Type': mysql_type, 'Key': ''}
+    texts = fm.build_verify_column_texts(col['Field'], fm.get_postgresql_column_type(table_name, col))
+    if texts is None:
+        return None
+    # 필드명은 원래 대소문자(MySQL)와 소문자(PostgreSQL)로 들어가므로 비교하기 쉽게 맞춤
+    return texts[0].replace('`C`', '`c`'), texts[1]
+
+
+class VerifyColumnTextsTest(unittest.TestCase):
+
+    def test_normalized_types(self):
+        for mysql_type, expected in VERIFY_CASES.items():
+            with self.subTest(mysql_type=mysql_type):
+                self.assertEqual(column_texts(mysql_type), expected)
+
+    def test_generic_types(self):
+        for mysql_type in GENERIC_TYPES:
+            with self.subTest(mysql_type=mysql_type):
+                mysql_text, pg_text = column_texts(mysql_type)
+                self.assertEqual(mysql_text, f'IF(CAST(`c` AS CHAR) {ZERO_CHECK}, NULL, CAST(`c` AS CHAR))')
+                self.assertEqual(pg_text, 'c::text')
+
+    def test_every_mapped_type_is_covered(self):
+        covered = set(VERIFY_CASES) | set(GENERIC_TYPES)
+        bases = {fm.parse_mysql_type(mysql_type)[0] for mysql_type in covered}
+        self.assertEqual(set(fm.MYSQL_TYPE_MAP) - bases, set())
+
+    def test_type_override_changes_rule(self):
+        fm.TYPE_OVERRIDES['t_override'] = {'c': 'SMALLINT'}
+        try:
+            self.assertEqual(column_texts('tinyint(1)', 't_override')[1], 'c::text')
+        finally:
+            del fm.TYPE_OVERRIDES['t_override']
+
+
+class VerifyExpressionsTest(unittest.TestCase):
+
+    def test_integer_primary_key_chunks(self):
+        schema = {'table_name': 'T', 'columns': [
+            {'Field': 'id', 'Type': 'int(11)', 'Key': 'PRI'},
+            {'Field': 'price', 'Type': 'double', 'Key': ''},
+            {'Field': 'memo', 'Type': 'text', 'Key': ''},
+        ]}
+        exprs = fm.build_verify_expressions(schema)
+        self.assertTrue(exprs['integer_pk'])
+        self.assertEqual(exprs['unverified'], ['price'])
+        self.assertEqual(exprs['mysql_chunk'], f'FLOOR(`id` / {fm.VERIFY_CHUNK_SIZE})')
+        self.assertNotIn('price', exprs['mysql_hash'])
+        self.assertNotIn('price', exprs['pg_hash'])
+        self.assertIn("COALESCE(memo::text, '\\N')", exprs['pg_hash'])
+
+    def test_all_columns_unverified(self):
+        schema = {'table_name': 'T', 'columns': [{'Field': 'v', 'Type': 'float', 'Key': ''}]}
+        exprs = fm.build_verify_expressions(schema)
+        self.assertFalse(exprs['integer_pk'])
+        self.assertEqual(exprs['mysql_hash'], "MD5(CONCAT_WS('|', ''))")
+        self.assertEqual(exprs['pg_hash'], "md5(concat_ws('|', ''))")
+
+
+if __name__ == '__main__':
+    unittest.main()